@@ -13,6 +13,7 @@ setup(
     description='Transfer big files fast between AWS S3 and EC2.  Pronounced semi.',
     long_description=open('README.md').read(),
     install_requires=install_requires,
+    python_requires=">=3.8",
     extras_require={},
     packages=None,
     package_dir=None,
@@ -27,8 +28,8 @@ setup(
         'Operating System :: MacOS :: MacOS X',
         'Operating System :: POSIX',
         'Programming Language :: Python',
-        'Programming Language :: Python :: 2.7',
-        'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3',
+        'Programming Language :: Python :: 3 :: Only',
         'Topic :: Software Development :: Libraries :: Python Modules'
     ]
 )